@@ -1,18 +1,156 @@
 import os
-import tempfile
-from warnings import warn
-from typing import Any, Union, BinaryIO, Optional, List, Dict
+from typing import TYPE_CHECKING, Any, Union, BinaryIO, Optional, List, Dict, Tuple, Iterator
 from ._schemas import StreamInfo, Config, MarkdownChunk, Chunk
 import re
-import base64
+from binascii import a2b_base64, b2a_base64
 from PIL import Image
 from io import BytesIO
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import threading
+from functools import lru_cache
+
+if TYPE_CHECKING:
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+# Use libvips for WebP conversion when it is available, it streams the image
+# through the resize and encode steps instead of decoding the full raster
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+
+# Use libjpeg-turbo to shrink JPEGs that only need resizing, it scales during
+# the DCT step so the full resolution image is never decoded
+try:
+    from turbojpeg import TurboJPEG
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _turbo_jpeg = None
+
+# Pattern to match markdown image syntax with base64 data. The groups use negated
+# character classes rather than lazy wildcards so malformed input is scanned
+# linearly instead of backtracking. Like the lazy wildcards they replace, the
+# alt text and mime type groups do not cross line breaks. Alt text may contain
+# "]" as long as it is not the one that closes it before "(data:", each
+# character can only match one of the two alternatives.
+_IMG_B64_RE = re.compile(
+    r'!\[((?:[^\]\n]|\](?!\(data:))*)\]\(data:([^;\s]+);base64,([^)\s]+)\s*\)')
+
+# Image chunks hold a single image, optionally surrounded by whitespace, so
+# they are matched at the start instead of searched
+_IMG_B64_ANCHORED_RE = re.compile(r'\s*' + _IMG_B64_RE.pattern)
+
+# WebP encoder effort, 0 (fastest) to 6 (smallest). The default of 4 takes
+# about twice as long as 2 for output only a few percent smaller.
+_WEBP_EFFORT = 2
+
+# Read size when base64 encoding streams, a multiple of 57 bytes (76 encoded
+# characters) so that full reads encode without padding
+_B64_READ_SIZE = 57 * 4096
+
+# Shared pool for image processing. Pillow releases the GIL while decoding,
+# resizing and encoding, so documents with several images are processed in
+# parallel. Created on first use and reused to avoid spawning threads per call.
+_image_executor: Optional[ThreadPoolExecutor] = None
+_image_executor_lock = threading.Lock()
+
+
+def _get_image_executor() -> ThreadPoolExecutor:
+    global _image_executor
+    if _image_executor is None:
+        with _image_executor_lock:
+            if _image_executor is None:
+                _image_executor = ThreadPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    thread_name_prefix="markitup-image",
+                )
+    return _image_executor
+
+
+def _b64encode_stream(stream: BinaryIO) -> str:
+    """Base64 encode the rest of a binary stream without reading it into memory at once."""
+    encoded = bytearray()
+    pending = b""
+    while chunk := stream.read(_B64_READ_SIZE):
+        if pending:
+            chunk = pending + chunk
+        # Short reads may not be a multiple of 3 bytes, carry the remainder
+        # over so padding only ever appears at the very end
+        usable = len(chunk) - len(chunk) % 3
+        encoded += b2a_base64(memoryview(chunk)[:usable], newline=False)
+        pending = chunk[usable:]
+    encoded += b2a_base64(pending, newline=False)
+    return encoded.decode('ascii')
+
+
+# Data URLs of processed images keyed by a digest of the source image and the
+# settings used, so that calling to_llm() again, or converting documents that share images,
+# skips the decode/resize/encode pipeline. Bounded by the size of the cached
+# base64 data rather than the number of entries.
+_IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_image_cache: "OrderedDict[Tuple[bytes, str, int, bool], str]" = OrderedDict()
+_image_cache_bytes = 0
+_image_cache_lock = threading.Lock()
+
+
+def _image_cache_get(key: Tuple[bytes, str, int, bool]) -> Optional[str]:
+    with _image_cache_lock:
+        value = _image_cache.get(key)
+        if value is not None:
+            _image_cache.move_to_end(key)
+        return value
+
+
+def _image_cache_put(key: Tuple[bytes, str, int, bool], value: str) -> None:
+    global _image_cache_bytes
+    size = len(value)
+    if size > _IMAGE_CACHE_MAX_BYTES:
+        return
+    with _image_cache_lock:
+        if key in _image_cache:
+            return
+        _image_cache[key] = value
+        _image_cache_bytes += size
+        while _image_cache_bytes > _IMAGE_CACHE_MAX_BYTES:
+            _, evicted = _image_cache.popitem(last=False)
+            _image_cache_bytes -= len(evicted)
+
+
+@lru_cache(maxsize=None)
+def _get_text_splitter(tiktoken_encoder: str, chunk_size: int) -> "RecursiveCharacterTextSplitter":
+    """
+    Return the shared token-based splitter used for chunking.
+
+    Building one loads the tiktoken encoding, so a splitter is made once per
+    (encoder, chunk size) pair and reused by every converter and result.
+    """
+    # Imported here, it is only needed for chunking and is slow to import
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+    # NOTE: from_tiktoken_encoder is a classmethod, so the custom separators
+    # this was once configured with on an instance never took effect. The
+    # default separators are what chunking has always used.
+    return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        model_name=tiktoken_encoder,
+        chunk_size=chunk_size,
+        chunk_overlap=0,
+    )
 
 
 class DocumentConverterResult:
     """The result of converting a document to Markdown."""
 
+    __slots__ = (
+        "markdown",
+        "markdown_chunk_list",
+        "audio_stream",
+        "title",
+        "stream_info",
+        "config",
+    )
+
     def __init__(
         self,
         markdown: str = "",
@@ -43,7 +181,7 @@ class DocumentConverterResult:
         self.stream_info = stream_info
         self.config = config
 
-    def to_llm(self) -> List[Dict[str, Any]]:
+    def to_llm(self) -> List[Union[Dict[str, Any], Chunk]]:
         """
         Convert markdown with base64 images to a format compatible with OpenAI's API.
 
@@ -57,35 +195,32 @@ class DocumentConverterResult:
             List[Dict[str, Any]]: A list of dictionaries representing the content elements
                                 (text and images) in their original order.
         """
+        return list(self.to_llm_iter())
+
+    def to_llm_iter(self) -> Iterator[Union[Dict[str, Any], Chunk]]:
+        """
+        Lazily yield the same content elements as to_llm().
+
+        Each element is yielded as soon as it is ready, so a consumer can start
+        sending the first elements while later images are still being processed.
+
+        Returns:
+            Iterator[Union[Dict[str, Any], Chunk]]: The content elements in their
+                                original order.
+        """
         # Check if chunking is enabled and markdown_chunk_list is available
         if self.config and self.config.chunk:
             if not self.markdown_chunk_list:
                 self.markdown_chunk_list = self._gen_markdown_chunk_list_from_md_content()
-            return self._process_chunked_content()
+            return self._iter_chunked_content()
         else:
-            return self._process_full_markdown()
+            return self._iter_full_markdown()
 
     def _gen_markdown_chunk_list_from_md_content(self) -> List[MarkdownChunk]:
-        llm_dict_list = self._process_full_markdown()
+        llm_dict_list = self._iter_full_markdown()
         chunks = []
         chunk_id = 0
-        _chunker = RecursiveCharacterTextSplitter(
-            separators=[
-                "\n#{1,6} ",  # Headers (H1 through H6)
-                "```\n",      # Code blocks
-                "\n\\*\\*\\*+\n",  # Horizontal lines (*)
-                "\n\n",       # Double new lines
-                "\n",         # New line
-                " ",          # Spaces
-                "",           # Character
-            ],
-            keep_separator=True,
-            is_separator_regex=True,  # Enable regex for complex separators
-        ).from_tiktoken_encoder(
-            model_name=self.config.tiktoken_encoder,
-            chunk_size=self.config.chunk_size,
-            chunk_overlap=0,
-        )
+        _chunker = _get_text_splitter(self.config.tiktoken_encoder, self.config.chunk_size)
         for item in llm_dict_list:
             if item['type'] == "text":
                 # chunk the text parts
@@ -113,155 +248,167 @@ class DocumentConverterResult:
                 chunks.append(image_chunk)
         return chunks
 
-    def _process_chunked_content(self) -> List[Chunk]:
+    def _iter_chunked_content(self) -> Iterator[Chunk]:
         """
         Process content when chunking is enabled.
 
-        Returns:
-            List[Chunk]: A list of Chunk objects with appropriate metadata.
+        Yields:
+            Chunk: Chunk objects with appropriate metadata.
         """
-        chunks = []
+        max_size, use_webp = self._image_options()
+        # Bind the lookups used on every iteration to locals
+        match_image = _IMG_B64_ANCHORED_RE.match
 
         for markdown_chunk in self.markdown_chunk_list:
             if isinstance(markdown_chunk, Chunk):
-                chunks.append(markdown_chunk.model_copy(deep=True))
+                yield markdown_chunk.model_copy(deep=True)
                 continue
+            location = self._chunk_location(markdown_chunk)
             if markdown_chunk.chunk_modality == "text":
-                # Create text chunk
-                text_content = {
-                    "type": "text",
-                    "text": markdown_chunk.content
-                }
-
                 # Create Chunk object for text
                 text_chunk = Chunk(
                     chunk_modality="text",
-                    chunk_id=markdown_chunk.chunk_id,
-                    content=text_content,
-                    page_id=markdown_chunk.page_id,
-                    bbox_list=markdown_chunk.bbox_list
+                    content={
+                        "type": "text",
+                        "text": markdown_chunk.content
+                    },
+                    **location
                 )
-                chunks.append(text_chunk)
+                yield text_chunk
 
             elif markdown_chunk.chunk_modality == "image":
                 # For other than pdf, the image_dict here is already present, no need to match
                 if isinstance(markdown_chunk.content, dict):
                     image_chunk = Chunk(
                         chunk_modality="image",
-                        chunk_id=markdown_chunk.chunk_id,
                         content=markdown_chunk.content,
-                        page_id=markdown_chunk.page_id,
-                        bbox_list=markdown_chunk.bbox_list
+                        **location
                     )
-                    chunks.append(image_chunk)
+                    yield image_chunk
                 else:
-                    # Pattern to match markdown image syntax with base64 data
-                    pattern = r'!\[(.*?)\]\(data:(.*?);base64,(.*?)\s*\)'
-
                     # Process image chunk
-                    match = re.search(pattern, markdown_chunk.content)
+                    match = match_image(markdown_chunk.content)
                     if match:
-                        alt_text, content_type, b64_data = match.groups()
-
-                        # Decode base64 data
-                        img_data = base64.b64decode(b64_data)
-
-                        # Process image and get formatted result
-                        try:
-                            image_dict = self._process_image(img_data, content_type)
-                        except Exception as e:
-                            if not self.config.ignore_unsupported_image:
-                                raise
-                            image_dict = {
-                                'type': 'text',
-                                'text': f'unsupported {content_type!r} image {alt_text!r}: {e}'
-                            }
-                            chunks.append(Chunk(
-                                chunk_modality="text",
-                                chunk_id=markdown_chunk.chunk_id,
-                                content=image_dict,
-                                page_id=markdown_chunk.page_id,
-                                bbox_list=markdown_chunk.bbox_list
-                            ))
-                        else:
-                            # Create Chunk object for image
-                            image_chunk = Chunk(
-                                chunk_modality="image",
-                                chunk_id=markdown_chunk.chunk_id,
-                                content=image_dict,
-                                page_id=markdown_chunk.page_id,
-                                bbox_list=markdown_chunk.bbox_list
-                            )
-                            chunks.append(image_chunk)
-
-        return chunks
+                        image_dict = self._process_image_or_placeholder(
+                            *match.groups(), max_size=max_size, use_webp=use_webp)
+                        # Unsupported images come back as a text placeholder
+                        modality = "image" if image_dict["type"] == "image_url" else "text"
+                        yield Chunk(
+                            chunk_modality=modality,
+                            content=image_dict,
+                            **location
+                        )
+
+    @staticmethod
+    def _chunk_location(markdown_chunk: MarkdownChunk) -> Dict[str, Any]:
+        """The location fields a Chunk inherits from its MarkdownChunk."""
+        return {
+            "chunk_id": markdown_chunk.chunk_id,
+            "page_id": markdown_chunk.page_id,
+            "bbox_list": markdown_chunk.bbox_list,
+        }
 
-    def _process_full_markdown(self) -> List[Dict[str, Any]]:
+    def _iter_full_markdown(self) -> Iterator[Dict[str, Any]]:
         """
         Process the full markdown when chunking is disabled.
 
-        Returns:
-            List[Dict[str, Any]]: A list of content elements.
+        Yields:
+            Dict[str, Any]: The content elements in their original order.
         """
-        # Pattern to match markdown image syntax with base64 data
-        pattern = r'!\[(.*?)\]\(data:(.*?);base64,(.*?)\s*\)'
-
-        content = []
-        last_end = 0
+        max_size, use_webp = self._image_options()
+
+        # Splitting on the image pattern yields the text in between the images
+        # interleaved with the captured groups of each image:
+        # [text, alt_text, content_type, b64_data, text, ..., text]
+        # Most documents have no images at all, a substring check is far
+        # cheaper than running the regex over the whole document.
+        if "!" in self.markdown:
+            parts = _IMG_B64_RE.split(self.markdown)
+        else:
+            parts = [self.markdown]
+        images = [parts[i + 1:i + 4] for i in range(0, len(parts) - 1, 4)]
 
-        # Process the document sequentially to maintain order
-        for match in re.finditer(pattern, self.markdown):
-            # Add the text before this image if any
-            if match.start() > last_end:
-                text_chunk = self.markdown[last_end:match.start()].strip()
-                if text_chunk:
-                    content.append({
-                        "type": "text",
-                        "text": text_chunk
-                    })
+        process_image = self._process_image_or_placeholder
 
-            # Extract image data
-            alt_text, content_type, b64_data = match.groups()
+        def process(image):
+            return process_image(*image, max_size=max_size, use_webp=use_webp)
 
-            # Decode base64 data
-            img_data = base64.b64decode(b64_data)
+        # Results are yielded in the original order, so they can be merged
+        # back with the surrounding text
+        if len(images) > 1:
+            image_dicts = _get_image_executor().map(process, images)
+        else:
+            image_dicts = map(process, images)
 
-            # Process image and get formatted result
-            try:
-                image_dict = self._process_image(img_data, content_type)
-                content.append(image_dict)
-            except Exception as e:
-                if not self.config.ignore_unsupported_image:
-                    raise
-                content.append({
-                    'type': 'text',
-                    'text': f'unsupported {content_type!r} image {alt_text!r}: {e}'
-                })
+        # Process the document sequentially to maintain order
+        for i, image_dict in zip(range(0, len(parts) - 1, 4), image_dicts):
+            # Add the text before this image if any. Gaps between adjacent
+            # images are usually whitespace only, isspace() rules those out
+            # without allocating a stripped copy.
+            text_chunk = parts[i]
+            if text_chunk and not text_chunk.isspace():
+                yield {
+                    "type": "text",
+                    "text": text_chunk.strip()
+                }
 
-            last_end = match.end()
+            yield image_dict
 
         # Add any remaining text after the last image
-        if last_end < len(self.markdown):
-            text_chunk = self.markdown[last_end:].strip()
-            if text_chunk:
-                content.append({
-                    "type": "text",
-                    "text": text_chunk
-                })
+        text_chunk = parts[-1]
+        if text_chunk and not text_chunk.isspace():
+            yield {
+                "type": "text",
+                "text": text_chunk.strip()
+            }
 
         # Add audio if present
         if self.audio_stream:
-            audio_b64 = base64.b64encode(
-                self.audio_stream.read()).decode('utf-8')
-            content.append({
+            audio_b64 = _b64encode_stream(self.audio_stream)
+            yield {
                 "type": "media",
                 "mime_type": self.stream_info.magic_type,
                 "data": audio_b64
-            })
+            }
 
-        return content
+    def _image_options(self) -> Tuple[int, bool]:
+        """Read the image processing settings from the config once per document."""
+        max_size = getattr(self.config, "image_max_width_or_height", 0) or 0
+        use_webp = bool(getattr(self.config, "image_use_webp", False))
+        return max_size, use_webp
 
-    def _process_image(self, image_data: bytes, content_type: str) -> Dict[str, Any]:
+    def _process_image_or_placeholder(
+        self,
+        alt_text: str,
+        content_type: str,
+        b64_data: str,
+        *,
+        max_size: int,
+        use_webp: bool,
+    ) -> Dict[str, Any]:
+        """
+        Process an image, replacing it with a text placeholder if it cannot be
+        processed and ignore_unsupported_image is set.
+        """
+        try:
+            return self._process_image(
+                b64_data, content_type, max_size=max_size, use_webp=use_webp)
+        except Exception as e:
+            if not getattr(self.config, "ignore_unsupported_image", False):
+                raise
+            return {
+                'type': 'text',
+                'text': f'unsupported {content_type!r} image {alt_text!r}: {e}'
+            }
+
+    def _process_image(
+        self,
+        b64_data: str,
+        content_type: str,
+        *,
+        max_size: int,
+        use_webp: bool,
+    ) -> Dict[str, Any]:
         """
         Process image data according to configuration settings and return a formatted dictionary.
 
@@ -270,49 +417,146 @@ class DocumentConverterResult:
         2. Converting to WebP format if image_use_webp is enabled
         3. Formatting the result as a dictionary ready for the API
 
+        When neither step changes the image, only the header is parsed and the
+        original base64 data is reused as-is instead of being re-encoded. Processed images are
+        cached as data URLs, keyed by a digest of the image data and the settings.
+
         Parameters:
-        - image_data: The original image data as bytes
+        - b64_data: The original image data, base64 encoded
         - content_type: The original mime type of the image
-        - metadata: Optional metadata to include in the response
-        - quality: The quality setting (0-100) for WebP conversion
+        - max_size: The maximum width or height, 0 disables resizing
+        - use_webp: Whether to convert the image to WebP
 
         Returns:
         - Dict[str, Any]: Formatted dictionary with processed image data
         """
-        img = Image.open(BytesIO(image_data))
-        original_width, original_height = img.size
-
-        # Resize if needed based on config
-        if hasattr(self.config, "image_max_width_or_height") and self.config.image_max_width_or_height > 0:
-            max_size = self.config.image_max_width_or_height
-
-            # Calculate resize ratio if either dimension exceeds max size
-            if original_width > max_size or original_height > max_size:
-                ratio = min(max_size / original_width,
-                            max_size / original_height)
-                new_width = int(original_width * ratio)
-                new_height = int(original_height * ratio)
-                img = img.resize((new_width, new_height), Image.LANCZOS)
-
-        # Process according to config
-        if self.config.image_use_webp:
-            # Convert to WebP
-            processed_data = self._convert_image_to_webp(img, quality=80)
-            content_type = "image/webp"
-
-        # Convert to base64
-        b64_data = base64.b64encode(processed_data).decode('utf-8')
+        if max_size > 0 or use_webp:
+            image_data = a2b_base64(b64_data)
+            cache_key = (
+                hashlib.blake2b(image_data, digest_size=16).digest(),
+                content_type,
+                max_size,
+                use_webp,
+            )
+            # The cache holds the finished data URL, so a hit does not
+            # rebuild the (potentially multi-MB) string either
+            url = _image_cache_get(cache_key)
+            if url is None:
+                content_type, b64_data = self._transform_image(
+                    image_data, b64_data, content_type, max_size=max_size, use_webp=use_webp)
+                url = f"data:{content_type};base64,{b64_data}"
+                _image_cache_put(cache_key, url)
+        else:
+            # Nothing to transform, but still make sure the header parses so
+            # unsupported images are reported as they are on the other paths.
+            # Image.open does not decode the pixels.
+            Image.open(BytesIO(a2b_base64(b64_data)))
+            url = f"data:{content_type};base64,{b64_data}"
 
         # Construct the result dictionary in OpenAI format
         result = {
             "type": "image_url",
             "image_url": {
-                "url": f"data:{content_type};base64,{b64_data}"
+                "url": url
             }
         }
 
         return result
 
+    def _transform_image(
+        self,
+        image_data: bytes,
+        b64_data: str,
+        content_type: str,
+        *,
+        max_size: int,
+        use_webp: bool,
+    ) -> Tuple[str, str]:
+        """
+        Resize and/or convert an image to WebP.
+
+        Returns:
+        - Tuple[str, str]: The resulting mime type and base64 encoded data
+        """
+        needs_resize = max_size > 0
+        if use_webp and pyvips is not None:
+            processed_data = self._convert_image_to_webp_vips(
+                image_data, max_size, quality=80)
+            return "image/webp", b2a_base64(processed_data, newline=False).decode('ascii')
+
+        # The turbojpeg path keeps the JPEG format, so it only applies when no
+        # WebP conversion was requested
+        if (needs_resize and not use_webp and _turbo_jpeg is not None
+                and image_data[:2] == b"\xff\xd8"):
+            processed_data = self._resize_jpeg_turbo(image_data, max_size)
+            if processed_data is not None:
+                return content_type, b2a_base64(processed_data, newline=False).decode('ascii')
+
+        # Image.open only parses the header, the pixels are decoded lazily
+        img = Image.open(BytesIO(image_data))
+        original_format = img.format
+        original_size = img.size
+
+        # Shrink in place if either dimension exceeds max size. thumbnail
+        # keeps the aspect ratio, lets JPEGs downscale while decoding and
+        # uses a cheap reduce step before the final LANCZOS pass.
+        if needs_resize:
+            img.thumbnail((max_size, max_size), Image.LANCZOS, reducing_gap=2.0)
+        resized = img.size != original_size
+
+        # Process according to config
+        if use_webp:
+            # Convert to WebP
+            processed_data = self._convert_image_to_webp(img, quality=80)
+            return "image/webp", b2a_base64(processed_data, newline=False).decode('ascii')
+        if resized:
+            # Keep the original format for the resized image
+            buffer = BytesIO()
+            img.save(buffer, format=original_format or "PNG")
+            return content_type, b2a_base64(buffer.getvalue(), newline=False).decode('ascii')
+        return content_type, b64_data
+
+    def _resize_jpeg_turbo(self, image_data: bytes, max_size: int) -> Optional[bytes]:
+        """
+        Shrink a JPEG to fit max_size, decoding it with libjpeg-turbo's DCT scaling.
+
+        The image is decoded at the smallest scaling factor that keeps it at
+        least max_size, so the full resolution raster is never built, and is
+        then resized to the exact bound like the Pillow path does.
+
+        Parameters:
+        - image_data: The original JPEG data as bytes
+        - max_size: The maximum width or height
+
+        Returns:
+        - The resized JPEG data, or None if the image already fits or
+          libjpeg-turbo cannot decode it.
+        """
+        width, height = _turbo_jpeg.decode_header(image_data)[:2]
+        longest = max(width, height)
+        if longest <= max_size:
+            return None
+
+        # libjpeg-turbo rounds scaled dimensions up, 1/1 always qualifies
+        scaling_factor = min(
+            ((num, denom) for num, denom in _turbo_jpeg.scaling_factors
+             if -(-longest * num // denom) >= max_size),
+            key=lambda factor: factor[0] / factor[1],
+        )
+        try:
+            pixels = _turbo_jpeg.decode(image_data, scaling_factor=scaling_factor)
+        except OSError:
+            # e.g. CMYK JPEGs, which the Pillow path handles
+            return None
+
+        # decode() returns BGR pixels by default
+        img = Image.frombuffer(
+            "RGB", (pixels.shape[1], pixels.shape[0]), pixels, "raw", "BGR", 0, 1)
+        img.thumbnail((max_size, max_size), Image.LANCZOS)
+        buffer = BytesIO()
+        img.save(buffer, format="JPEG")
+        return buffer.getvalue()
+
     def _convert_image_to_webp(self, img, quality: int = 80) -> bytes:
         """
         Convert a PIL Image to WebP format.
@@ -330,10 +574,31 @@ class DocumentConverterResult:
 
         # Save as WebP to a BytesIO object
         webp_buffer = BytesIO()
-        img.save(webp_buffer, format="WEBP", quality=quality)
+        img.save(webp_buffer, format="WEBP", quality=quality, method=_WEBP_EFFORT)
         webp_buffer.seek(0)
         return webp_buffer.read()
 
+    def _convert_image_to_webp_vips(self, image_data: bytes, max_size: int, quality: int = 80) -> bytes:
+        """
+        Resize and convert encoded image data to WebP format using libvips.
+
+        Parameters:
+        - image_data: The original image data as bytes
+        - max_size: The maximum width or height, 0 disables resizing
+        - quality: The quality setting (0-100) for WebP conversion.
+
+        Returns:
+        - WebP converted image data as bytes.
+        """
+        if max_size > 0:
+            # thumbnail_buffer shrinks while decoding where the format allows it
+            img = pyvips.Image.thumbnail_buffer(
+                image_data, max_size, height=max_size, size="down")
+        else:
+            img = pyvips.Image.new_from_buffer(
+                image_data, "", access="sequential")
+        return img.write_to_buffer(f".webp[Q={quality},strip,effort={_WEBP_EFFORT}]")
+
     def __str__(self) -> str:
         """Return the converted Markdown text."""
         return self.markdown
@@ -342,8 +607,10 @@ class DocumentConverterResult:
 class DocumentConverter:
     """Abstract superclass of all DocumentConverters."""
 
-    def __init__(self, config: Config):
-        self.config = config
+    __slots__ = ("config",)
+
+    def __init__(self, config: Optional[Config] = None):
+        self.config = config if config is not None else Config()
 
     def convert(
         self,
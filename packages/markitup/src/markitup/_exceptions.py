@@ -34,10 +34,17 @@ class UnsupportedFormatException(Exception):
 class FailedConversionAttempt(Exception):
     """
     Represents a single attempt to convert a file.
+
+    The converter's class name is captured up front so that reporting the
+    failure does not need to inspect the converter again. It is None when no
+    converter was given.
     """
 
-    def __init__(self):
+    def __init__(self, converter: Any = None, exc_info: Optional[tuple] = None):
         super().__init__(f"Conversion attempt failed!")
+        self.converter = converter
+        self.converter_name = type(converter).__name__ if converter is not None else None
+        self.exc_info = exc_info
 
 
 class FileConversionException(Exception):
@@ -57,11 +64,13 @@ class FileConversionException(Exception):
             if attempts is None:
                 message = "File conversion failed."
             else:
-                message = f"File conversion failed after {len(attempts)} attempts:\n"
+                parts = [f"File conversion failed after {len(attempts)} attempts:\n"]
                 for attempt in attempts:
+                    converter_name = attempt.converter_name or "Unknown converter"
                     if attempt.exc_info is None:
-                        message += f" -  {type(attempt.converter).__name__} provided no execution info."
+                        parts.append(f" - {converter_name} provided no execution info.\n")
                     else:
-                        message += f" - {type(attempt.converter).__name__} threw {attempt.exc_info[0].__name__} with message: {attempt.exc_info[1]}\n"
+                        parts.append(f" - {converter_name} threw {attempt.exc_info[0].__name__} with message: {attempt.exc_info[1]}\n")
+                message = "".join(parts)
 
         super().__init__(message)
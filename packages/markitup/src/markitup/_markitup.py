@@ -1,6 +1,10 @@
-from typing import Dict, Optional, BinaryIO
+from typing import Dict, Optional, BinaryIO, Tuple, Type, Union
 import filetype
+import io
 import mimetypes
+import os
+import re
+import threading
 
 # Try to import python-magic for more accurate file type detection
 try:
@@ -10,18 +14,7 @@ except ImportError:
 
 from ._schemas import StreamInfo, Config
 
-from .converters import (
-    PlainTextConverter,
-    HtmlConverter,
-    ImageConverter,
-    PdfConverter,
-    DocxConverter,
-    XlsxConverter,
-    XlsConverter,
-    PptxConverter,
-    AudioConverter,
-    CsvConverter,
-)
+from . import converters as _converters
 
 from ._base_converter import DocumentConverter, DocumentConverterResult
 
@@ -31,6 +24,89 @@ from ._exceptions import (
     FailedConversionAttempt,
 )
 
+# libmagic and filetype identify almost every format from signatures near the
+# start of the file, so only a bounded header is read for detection
+_SNIFF_SIZE = 8192
+
+# Containers whose concrete type is only found deeper in the file (e.g. the
+# directory of an OLE file), these are re-checked against the whole stream
+_DEEP_SNIFF_TYPES = frozenset({
+    "application/x-ole-storage",
+    "application/zip",
+    "application/octet-stream",
+})
+
+# libmagic handles are not thread safe, each thread opens its own once
+_magic_local = threading.local()
+
+
+def _magic_from_buffer(buffer: bytes) -> str:
+    """Detect the MIME type of buffer with this thread's libmagic handle."""
+    detector = getattr(_magic_local, "detector", None)
+    if detector is None:
+        detector = _magic_local.detector = magic.Magic(mime=True)
+    return detector.from_buffer(buffer)
+
+
+_SUPPORTED_IMAGE_TYPES = frozenset({"image/webp", "image/jpeg", "image/png", "image/jpg"})
+
+# Categories for MIME types that are matched exactly
+_MIME_CATEGORIES = {
+    **dict.fromkeys(_SUPPORTED_IMAGE_TYPES, "image"),
+    "audio/mpeg": "audio",
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation": "pptx",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx",
+    "application/pdf": "pdf",
+    "application/csv": "csv",
+    "text/csv": "csv",
+    "text/html": "html",
+}
+
+# Categories for everything else, by MIME type prefix, checked in order
+_MIME_PREFIX_CATEGORIES = (
+    ("image/", "other"),
+    ("video/", "video"),
+    ("application/vnd.ms-excel", "xls"),
+    ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "xlsx"),
+    ("application/vnd.ms-powerpoint", "ppt"),
+    ("application/msword", "doc"),
+    ("text/", "text"),
+)
+
+# MIME types for extensions that identify a file unambiguously, used by
+# MarkItUp.from_path to skip content sniffing
+_EXTENSION_MIME_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".xls": "application/vnd.ms-excel",
+    ".csv": "text/csv",
+    ".html": "text/html",
+    ".htm": "text/html",
+    ".txt": "text/plain",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".mp3": "audio/mpeg",
+}
+
+# The prefixes as one alternation, the name of the group that matched is the
+# category. Alternatives are tried in order, preserving the table's precedence.
+_MIME_PREFIX_RE = re.compile("|".join(
+    f"(?P<{category}>{re.escape(prefix)})" for prefix, category in _MIME_PREFIX_CATEGORIES
+))
+
+
+def _mime_category(magic_type: str) -> str:
+    """Determine the file category for a MIME type."""
+    category = _MIME_CATEGORIES.get(magic_type)
+    if category is None:
+        match = _MIME_PREFIX_RE.match(magic_type)
+        category = match.lastgroup if match else "other"
+    return category
+
 
 class MarkItUp:
     """(In preview) An extremely simple text-based document reader, suitable for LLM use.
@@ -38,33 +114,72 @@ class MarkItUp:
 
     def __init__(
         self,
-        config: Config = Config(),
+        config: Optional[Config] = None,
         plugins: Optional[Dict[str, DocumentConverter]] = None,
     ):
-        self.config = config
+        self.config = config if config is not None else Config()
         self.accepted_categories = ["text", "image", "audio", "pdf", "docx", "pptx", "xlsx", "xls", "csv", "html"]
-        self.converters = {
-            "text": PlainTextConverter,
-            "image": ImageConverter,
-            "audio": AudioConverter,
-            "pdf": PdfConverter,
-            "docx": DocxConverter,
-            "pptx": PptxConverter,
-            "xlsx": XlsxConverter,
-            "xls": XlsConverter,
-            "csv": CsvConverter,
-            "html": HtmlConverter,
+        # Built-in converters are named rather than imported here, so that a
+        # converter's backend is only loaded once a file of its type shows up
+        self.converters: Dict[str, Union[str, Type[DocumentConverter]]] = {
+            "text": "PlainTextConverter",
+            "image": "ImageConverter",
+            "audio": "AudioConverter",
+            "pdf": "PdfConverter",
+            "docx": "DocxConverter",
+            "pptx": "PptxConverter",
+            "xlsx": "XlsxConverter",
+            "xls": "XlsConverter",
+            "csv": "CsvConverter",
+            "html": "HtmlConverter",
         }
         if plugins:
             for plugin_name, converter in plugins.items():
                 self.converters[plugin_name] = converter
-        
-    def convert(self, stream: BinaryIO, file_name: str, **kwargs) -> Dict[DocumentConverterResult, StreamInfo]:
-        stream_info: StreamInfo = self._get_stream_info(stream, file_name)
+        # Converter instances, created on first use and reused across calls
+        self._converter_instances: Dict[str, DocumentConverter] = {}
+
+    @classmethod
+    def from_path(cls, path: Union[str, os.PathLike]) -> Tuple[BinaryIO, StreamInfo]:
+        """
+        Open a file for conversion and describe it from its extension.
+
+        The stream info is derived from the extension alone when it is an
+        unambiguous one, otherwise the file content is sniffed as usual. The
+        caller owns the returned stream and must close it.
+
+        Example:
+            stream, stream_info = MarkItUp.from_path("report.pdf")
+            with stream:
+                result, _ = miu.convert(stream, "report.pdf", stream_info=stream_info)
+        """
+        stream = open(path, "rb")
+        try:
+            magic_type = _EXTENSION_MIME_TYPES.get(os.path.splitext(path)[1].lower())
+            if magic_type is None:
+                stream_info = cls._get_stream_info(stream, os.fspath(path))
+            else:
+                stream_info = StreamInfo(magic_type=magic_type, category=_mime_category(magic_type))
+        except BaseException:
+            # The caller never receives the stream, so it is closed here
+            stream.close()
+            raise
+        return stream, stream_info
+
+    def convert(
+        self,
+        stream: BinaryIO,
+        file_name: str,
+        stream_info: Optional[StreamInfo] = None,
+        **kwargs,
+    ) -> Dict[DocumentConverterResult, StreamInfo]:
+        # Only sniff the content when the caller did not already categorize it
+        if stream_info is None or stream_info.category is None:
+            stream_info = self._get_stream_info(stream, file_name)
         # Deal with unsupported file types
         try:
             if stream_info.category in self.converters.keys():
-                converter = self.converters[stream_info.category](config=self.config)
+                converter = self._get_converter(stream_info.category)
                 return converter.convert(stream, stream_info, **kwargs), stream_info
             else:
                 match stream_info.category:
@@ -81,63 +196,51 @@ class MarkItUp:
             raise FileConversionException(
                 f"Failed to convert file of type {stream_info.magic_type}")
 
-    def _get_stream_info(self, byte_stream: BinaryIO, filename: str) -> StreamInfo:
+    def _get_converter(self, category: str) -> DocumentConverter:
+        """Return the converter instance for a category, creating it on first use."""
+        converter = self._converter_instances.get(category)
+        if converter is None:
+            converter_class = self.converters[category]
+            if isinstance(converter_class, str):
+                converter_class = getattr(_converters, converter_class)
+            converter = converter_class(config=self.config)
+            self._converter_instances[category] = converter
+        return converter
+
+    @classmethod
+    def _get_stream_info(cls, byte_stream: BinaryIO, filename: str) -> StreamInfo:
         byte_stream.seek(0)
 
-        # Get file content for analysis
-        file_content = byte_stream.read()
+        # Get the file header for analysis. A buffered reader can hand it out
+        # without consuming it, so the converter reads it from the buffer
+        # rather than from the file again.
+        peeked = isinstance(byte_stream, io.BufferedReader)
+        if peeked:
+            header = byte_stream.peek(_SNIFF_SIZE)[:_SNIFF_SIZE]
+        else:
+            header = byte_stream.read(_SNIFF_SIZE)
 
         # Use python-magic for more accurate detection if available
         if magic:
             try:
-                magic_type = magic.from_buffer(file_content, mime=True)
+                magic_type = _magic_from_buffer(header)
+                if magic_type in _DEEP_SNIFF_TYPES:
+                    # Ambiguous from the header alone, look at the whole file
+                    content = byte_stream.read() if peeked else header + byte_stream.read()
+                    if len(content) > len(header):
+                        magic_type = _magic_from_buffer(content)
             except Exception:
                 # Fallback to filetype.py if python-magic fails
-                magic_type = self._get_filetype_mime(file_content, filename)
+                magic_type = cls._get_filetype_mime(header, filename)
         else:
             # Use filetype.py when python-magic is not available
-            magic_type = self._get_filetype_mime(file_content, filename)
-
-        # Determine file category based on magic_type
-        if magic_type.startswith("image/"):
-            if magic_type in ["image/webp", "image/jpeg", "image/png", "image/jpg"]:
-                category = "image"
-            else:
-                category = "other"
-        elif magic_type ==("audio/mpeg"):
-            category = "audio"
-        elif magic_type.startswith("video/"):
-            category = "video"
-        elif magic_type.startswith("application/vnd.ms-excel"):
-            category = 'xls'
-        elif magic_type.startswith("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"):
-            category = "xlsx"
-        elif magic_type.startswith("application/vnd.ms-powerpoint"):
-            category = 'ppt'
-        elif magic_type == "application/vnd.openxmlformats-officedocument.presentationml.presentation":
-            category = "pptx"
-        elif magic_type.startswith("application/msword"):
-            category = 'doc'
-        elif magic_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-            category = "docx"
-        elif magic_type == "application/pdf":
-            category = "pdf"
-        elif magic_type == "application/csv":
-            category = "csv"
-        elif magic_type.startswith("text/"):
-            if magic_type == "text/csv":
-                category = "csv"
-            elif magic_type == "text/html":
-                category = "html"
-            else:
-                category = "text"
-        else:
-            category = "other"
+            magic_type = cls._get_filetype_mime(header, filename)
 
         byte_stream.seek(0)
-        return StreamInfo(magic_type=magic_type, category=category)
+        return StreamInfo(magic_type=magic_type, category=_mime_category(magic_type))
 
-    def _get_filetype_mime(self, file_content: bytes, filename: str) -> str:
+    @staticmethod
+    def _get_filetype_mime(file_content: bytes, filename: str) -> str:
         """Get MIME type using filetype library with filename fallback."""
         # Use filetype.py to determine file type based on content
         kind = filetype.guess(file_content)
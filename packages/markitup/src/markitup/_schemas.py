@@ -1,5 +1,6 @@
-from ast import Tuple
-from typing import Optional, List, Literal, Dict, Any, Tuple, override
+from typing import Optional, List, Literal, Dict, Any
+
+from dataclasses import dataclass, field
 
 from pydantic import BaseModel, Field
 
@@ -8,7 +9,11 @@ CHUNK_SIZE = 300
 TIKTOKEN_ENCODER = 'gpt-4'
 
 
-class StreamInfo(BaseModel):
+# StreamInfo, BBox and MarkdownChunk are created on every conversion and are
+# only built by our own code, so they are plain dataclasses rather than
+# validated Pydantic models
+@dataclass(slots=True)
+class StreamInfo:
     magic_type: Optional[str] = None
     category: Optional[str] = None
 
@@ -26,7 +31,8 @@ class Config(BaseModel):
     ignore_unsupported_image: bool = False
 
 
-class BBox(BaseModel):
+@dataclass(slots=True)
+class BBox:
     """
     A simple bounding box representation with coordinates.
 
@@ -40,7 +46,8 @@ class BBox(BaseModel):
     y1: float
 
 
-class MarkdownChunk(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class MarkdownChunk:
     chunk_modality: Literal["text", "image"]
 
     # LOCATION INFO
@@ -51,11 +58,11 @@ class MarkdownChunk(BaseModel):
 
     content: str  # The content of the chunk ONLY contains one type of modality
 
-    bbox_id_list: Optional[List[int]] = Field(
+    bbox_id_list: Optional[List[int]] = field(
         default_factory=list
     )  # The 0-based bounding box id of the chunk, currently exclusive for pdf
 
-    bbox_list: Optional[List[BBox]] = Field(
+    bbox_list: Optional[List[BBox]] = field(
         default_factory=list
     )  # The bounding box of the chunk, currently exclusive for pdf
 
@@ -2,27 +2,56 @@
 #
 # SPDX-License-Identifier: MIT
 
-from ._plain_text_converter import PlainTextConverter
-from ._html_converter import HtmlConverter
-from ._pdf_converter import PdfConverter
-from ._docx_converter import DocxConverter
-from ._xlsx_converter import XlsxConverter, XlsConverter
-from ._pptx_converter import PptxConverter
-from ._audio_converter import AudioConverter
-from ._csv_converter import CsvConverter
-from ._image_converter import ImageConverter
-from ._markdownify import _CustomMarkdownify
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._plain_text_converter import PlainTextConverter
+    from ._html_converter import HtmlConverter
+    from ._pdf_converter import PdfConverter
+    from ._docx_converter import DocxConverter
+    from ._xlsx_converter import XlsxConverter, XlsConverter
+    from ._pptx_converter import PptxConverter
+    from ._audio_converter import AudioConverter
+    from ._csv_converter import CsvConverter
+    from ._image_converter import ImageConverter
+    from ._markdownify import _CustomMarkdownify
+
+# Converters are imported on first access (PEP 562) so that their backends,
+# e.g. PyMuPDF for PDFs, are only loaded for the formats actually converted
+_SUBMODULES = {
+    "PlainTextConverter": "._plain_text_converter",
+    "HtmlConverter": "._html_converter",
+    "PdfConverter": "._pdf_converter",
+    "DocxConverter": "._docx_converter",
+    "XlsxConverter": "._xlsx_converter",
+    "XlsConverter": "._xlsx_converter",
+    "PptxConverter": "._pptx_converter",
+    "AudioConverter": "._audio_converter",
+    "CsvConverter": "._csv_converter",
+    "ImageConverter": "._image_converter",
+    "_CustomMarkdownify": "._markdownify",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
+
 
 __all__ = [
     "PlainTextConverter",
     "HtmlConverter",
-    "RssConverter",
     "_CustomMarkdownify",
-    "WikipediaConverter",
-    "YouTubeConverter",
-    "ImageConverter"
-    "IpynbConverter",
-    "BingSerpConverter",
     "PdfConverter",
     "DocxConverter",
     "XlsxConverter",
@@ -30,10 +59,5 @@ __all__ = [
     "PptxConverter",
     "ImageConverter",
     "AudioConverter",
-    "OutlookMsgConverter",
-    "ZipConverter",
-    "DocumentIntelligenceConverter",
-    "DocumentIntelligenceFileType",
-    "EpubConverter",
     "CsvConverter",
 ]
@@ -1,5 +1,4 @@
-import io
-from typing import Any, BinaryIO, Optional, Tuple
+from typing import Any, BinaryIO
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._schemas import StreamInfo, Config
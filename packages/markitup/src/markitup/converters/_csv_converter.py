@@ -1,4 +1,3 @@
-import sys
 import csv
 import io
 from typing import BinaryIO, Any
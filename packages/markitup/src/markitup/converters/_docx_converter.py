@@ -1,6 +1,4 @@
-import sys
-
-from typing import BinaryIO, Any
+from typing import BinaryIO, Any, Optional
 
 from ._html_converter import HtmlConverter
 from ..converter_utils.docx.pre_process import pre_process_docx
@@ -14,9 +12,9 @@ class DocxConverter(HtmlConverter):
     Converts DOCX files to Markdown. Style information (e.g.m headings) and tables are preserved where possible.
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Optional[Config] = None):
         super().__init__(config=config)
-        self._html_converter = HtmlConverter(config=config)
+        self._html_converter = HtmlConverter(config=self.config)
 
     def convert(
         self,
@@ -1,10 +1,6 @@
 import json
 import subprocess
 import locale
-import sys
-import shutil
-import os
-import warnings
 from typing import BinaryIO, Any, Union
 
 
@@ -1,7 +1,7 @@
 from typing import BinaryIO, Any
 from .._base_converter import DocumentConverter, DocumentConverterResult
+from ..converter_utils.utils import b64encode
 from .._schemas import StreamInfo, Config
-import base64
 
 
 class ImageConverter(DocumentConverter):
@@ -29,7 +29,7 @@ class ImageConverter(DocumentConverter):
                 image_ext = "webp"
 
         if 'image' in self.config.modalities:
-            img_base64 = base64.b64encode(image_bytes).decode('utf-8')
+            img_base64 = b64encode(image_bytes).decode('ascii')
 
             # Create markdown with embedded image
             markdown_content = f"![Image](data:image/{image_ext};base64,{img_base64})\n\n"
@@ -1,11 +1,10 @@
 from typing import BinaryIO, Any, Tuple, List, Dict
 import pymupdf4llm
 from collections import Counter
-from .._base_converter import DocumentConverter, DocumentConverterResult
-from .._schemas import StreamInfo, Config, MarkdownChunk, BBox
+from .._base_converter import DocumentConverter, DocumentConverterResult, _get_text_splitter
+from ..converter_utils.utils import b64encode
+from .._schemas import StreamInfo, MarkdownChunk, BBox
 import fitz
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-import base64
 import logging
 logger = logging.getLogger(__name__)
 
@@ -14,32 +13,15 @@ class PdfConverter(DocumentConverter):
     """
     Converts PDFs to Markdown with embedded images.
     """
-    def __init__(self, config: Config):
-        super().__init__(config=config)
-        self._chunker = RecursiveCharacterTextSplitter(
-            separators=[
-                "\n#{1,6} ",  # Headers (H1 through H6)
-                "```\n",      # Code blocks
-                "\n\\*\\*\\*+\n",  # Horizontal lines (*)
-                "\n\n",       # Double new lines
-                "\n",         # New line
-                " ",          # Spaces
-                "",           # Character
-            ],
-            keep_separator=True,
-            is_separator_regex=True,  # Enable regex for complex separators
-        ).from_tiktoken_encoder(
-            model_name=self.config.tiktoken_encoder,
-            chunk_size=self.config.chunk_size,
-            chunk_overlap=0,
-        )
-
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        # Read per call, so changes to the shared config's modalities apply
+        want_images = "image" in self.config.modalities
+
         # Create a document object from the stream
         doc = fitz.open(stream=file_stream, filetype="pdf")
 
@@ -48,7 +30,7 @@ class PdfConverter(DocumentConverter):
                 doc,
                 ignore_graphics=True,
                 table_strategy='lines',
-                embed_images=bool('image' in self.config.modalities),
+                embed_images=want_images,
                 page_chunks=False)
             return DocumentConverterResult(
                 markdown=md_content,
@@ -64,6 +46,15 @@ class PdfConverter(DocumentConverter):
             embed_images=False,
             page_chunks=True)
 
+        # Without the image modality, image blocks are left out of the page
+        # dict so their pixel data is never decoded
+        if want_images:
+            text_flags = fitz.TEXTFLAGS_DICT
+        else:
+            text_flags = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+        chunker = _get_text_splitter(self.config.tiktoken_encoder, self.config.chunk_size)
+
         final_chunk_list = []
         for idx, pdf_dict in enumerate(pdf_dict_list):
             md_content = pdf_dict['text']
@@ -71,16 +62,18 @@ class PdfConverter(DocumentConverter):
 
             # 处理无文本内容的页面：使用整页截图作为替代
             if not md_content or not md_content.strip():
+                if not want_images:
+                    continue
                 image_chunk = process_empty_page_as_image(doc.load_page(idx), idx, len(final_chunk_list))
                 if image_chunk:
                     final_chunk_list.append(image_chunk)
                 continue
 
-            text_chunk_list = self._chunker.split_text(md_content)
+            text_chunk_list = chunker.split_text(md_content)
             categorical_list = create_categorical_mapping(text_chunk_list, words_tuple_list= words_tuple_list)
             block_categories = determine_block_categories(words_tuple_list, categorical_list)
             text_tuple_list = []
-            all_blocks_tuple_list = doc[idx].get_text('dict')
+            all_blocks_tuple_list = doc[idx].get_text('dict', flags=text_flags)
             for block_tuple in all_blocks_tuple_list['blocks']:
                 if 'lines' in block_tuple:
                     text_tuple_list.append(block_tuple)
@@ -98,7 +91,8 @@ class PdfConverter(DocumentConverter):
 
             # IMAGE CHUNK
             image_chunk_list = []
-            for image in pdf_dict['images']:
+            images = pdf_dict['images'] if want_images else []
+            for image in images:
                 try:
                     image_md_chunk = image_dict_to_chunk(
                         image_dict=all_blocks_tuple_list['blocks'][image['number']], page_id=idx
@@ -134,7 +128,7 @@ def image_dict_to_chunk(image_dict: Dict[str, Any], page_id: int) -> MarkdownChu
     image_data = image_dict.get('image', b'')
 
     if image_data:
-        base64_str = base64.b64encode(image_data).decode('utf-8')
+        base64_str = b64encode(image_data).decode('ascii')
         # Create a markdown image with base64 data
         # We determine image format from the 'ext' field, defaulting to jpeg
         img_format = image_dict.get('ext', 'jpeg')
@@ -282,7 +276,7 @@ def process_empty_page_as_image(page: fitz.Page, page_id: int, chunk_id_offset:
         # Render page to image (default 72 dpi is usually sufficient for screen viewing)
         pix = page.get_pixmap()
         img_bytes = pix.tobytes("png")
-        base64_str = base64.b64encode(img_bytes).decode("utf-8")
+        base64_str = b64encode(img_bytes).decode("ascii")
 
         markdown_content = f"![Page {page_id + 1} Scan](data:image/png;base64,{base64_str})"
 
@@ -8,6 +8,11 @@ class PlainTextConverter(DocumentConverter):
     """Anything with content type text/plain"""    
     def convert(self, file_stream: BinaryIO, stream_info: StreamInfo, **kwargs: Any) -> DocumentConverterResult:
         content = file_stream.read()
-        text_content = str(from_bytes(content).best())
+        # Most text is UTF-8 (or ASCII), which decodes far faster than running
+        # charset detection. utf-8-sig also drops a leading BOM.
+        try:
+            text_content = content.decode("utf-8-sig")
+        except UnicodeDecodeError:
+            text_content = str(from_bytes(content).best())
         
         return DocumentConverterResult(markdown=text_content, config=self.config)
@@ -1,17 +1,14 @@
-import sys
-import base64
-import os
-import io
 import re
 import html
 
-from typing import BinaryIO, Any, List, Dict
-from operator import attrgetter
+from typing import BinaryIO, Any, Dict, List, Optional, Tuple
 
 from ._html_converter import HtmlConverter
 from .._base_converter import DocumentConverter, DocumentConverterResult
+from ..converter_utils.utils import b64encode
 from .._schemas import StreamInfo, Config, MarkdownChunk
 import pptx
+from pptx.enum.shapes import MSO_SHAPE_TYPE
 
 
 ACCEPTED_MAGIC_TYPE_PREFIXES = [
@@ -20,15 +17,38 @@ ACCEPTED_MAGIC_TYPE_PREFIXES = [
 
 ACCEPTED_FILE_CATEGORY = [".pptx"]
 
+# Shape types checked for every shape
+_PICTURE = MSO_SHAPE_TYPE.PICTURE
+_PLACEHOLDER = MSO_SHAPE_TYPE.PLACEHOLDER
+_TABLE = MSO_SHAPE_TYPE.TABLE
+_GROUP = MSO_SHAPE_TYPE.GROUP
+
+# Used to sanitize picture alt text and file names
+_ALT_TEXT_SPECIAL_RE = re.compile(r"[\r\n\[\]]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_WORD_RE = re.compile(r"\W")
+
+
+
+def _shape_position(shape) -> Tuple[int, int]:
+    # Shapes without an explicit position (e.g. inherited placeholders)
+    # report None, sort them as if placed at the origin
+    return (shape.top or 0, shape.left or 0)
+
+
+def _sorted_by_position(shapes) -> list:
+    """Return shapes in reading order, top to bottom then left to right."""
+    return sorted(shapes, key=_shape_position)
+
 
 class PptxConverter(DocumentConverter):
     """
     Converts PPTX files to Markdown. Supports heading, tables and images with alt text.
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Optional[Config] = None):
         super().__init__(config=config)
-        self._html_converter = HtmlConverter(config=config)
+        self._html_converter = HtmlConverter(config=self.config)
 
     def convert(
         self,
@@ -39,78 +59,18 @@ class PptxConverter(DocumentConverter):
 
         # Perform the conversion
         presentation = pptx.Presentation(file_stream)
-        md_content = ""
+        md_parts = []
         chunk_list = []
-        slide_num = 0
-
-        for slide in presentation.slides:
-            slide_num += 1
-            slide_text = ""
-            slide_images = []
-
-            def get_shape_content(shape, **kwargs):
-                nonlocal slide_text
-                # Pictures
-                if self._is_picture(shape):
-                    # https://github.com/scanny/python-pptx/pull/512#issuecomment-1713100069
-                    alt_text = ""
-
-                    try:
-                        alt_text = shape._element._nvXxPr.cNvPr.attrib.get("descr", "")
-                    except Exception:
-                        pass
-
-                    # Prepare the alt, escaping any special characters
-                    alt_text = "\n".join([alt_text]) or shape.name
-                    alt_text = re.sub(r"[\r\n\[\]]", " ", alt_text)
-                    alt_text = re.sub(r"\s+", " ", alt_text).strip()
-
-                    # Create image chunk
-                    if 'image' in self.config.modalities:
-                        blob = shape.image.blob
-                        content_type = shape.image.content_type or "image/png"
-                        b64_string = base64.b64encode(blob).decode("utf-8")
-                        image_md = f"\n![{alt_text}](data:{content_type};base64,{b64_string})\n"
-                        slide_images.append(image_md)
-                    else:
-                        filename = re.sub(r"\W", "", shape.name) + ".jpg"
-                        image_md = f"\n![{alt_text}]({filename})\n"
-                        slide_images.append(image_md)
-
-                # Tables
-                if self._is_table(shape):
-                    slide_text += self._convert_table_to_markdown(shape.table, **kwargs)
-
-                # Charts
-                if shape.has_chart:
-                    slide_text += self._convert_chart_to_markdown(shape.chart)
-
-                # Text areas
-                elif shape.has_text_frame:
-                    if shape == title:
-                        slide_text += "# " + shape.text.lstrip() + "\n"
-                    else:
-                        slide_text += shape.text + "\n"
-
-                # Group Shapes
-                if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.GROUP:
-                    sorted_shapes = sorted(shape.shapes, key=attrgetter("top", "left"))
-                    for subshape in sorted_shapes:
-                        get_shape_content(subshape, **kwargs)
-
-            title = slide.shapes.title
-            sorted_shapes = sorted(slide.shapes, key=attrgetter("top", "left"))
-            for shape in sorted_shapes:
-                get_shape_content(shape, **kwargs)
-
-            # Add notes if present
-            if slide.has_notes_slide:
-                notes_frame = slide.notes_slide.notes_text_frame
-                if notes_frame is not None:
-                    slide_text += "\n\n### Notes:\n" + notes_frame.text
+        # Encoded pictures by image part, logos and backgrounds repeat on
+        # many slides but are stored once in the package
+        b64_cache = {}
+        want_images = "image" in self.config.modalities
+
+        for slide_num, slide in enumerate(presentation.slides, start=1):
+            slide_text, slide_images = self._render_slide(
+                slide, b64_cache, want_images, **kwargs)
 
             # Create text chunk for the slide if there's any text content
-            slide_text = slide_text.strip()
             if slide_text:
                 chunk_list.append(MarkdownChunk(
                     chunk_modality='text',
@@ -128,46 +88,138 @@ class PptxConverter(DocumentConverter):
                     content=image_md
                 ))
 
-            # Add slide content to full markdown
-            md_content += f"\n\n<!-- Slide number: {slide_num} -->\n"
-            md_content += slide_text
-            md_content += "\n".join(slide_images)
-            md_content = md_content.strip()
+            # Add slide content to full markdown, joined once at the end
+            md_parts.append(
+                (f"\n\n<!-- Slide number: {slide_num} -->\n"
+                 + slide_text
+                 + "\n".join(slide_images)).rstrip()
+            )
 
         return DocumentConverterResult(
-            markdown=md_content.strip(),
+            markdown="".join(md_parts).strip(),
             markdown_chunk_list=chunk_list if self.config.chunk else None,
             config=self.config,
             stream_info=stream_info
         )
 
-    def _is_picture(self, shape):
-        if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE:
-            return True
-        if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.PLACEHOLDER:
-            if hasattr(shape, "image"):
-                return True
-        return False
+    def _render_slide(
+        self,
+        slide,
+        b64_cache: Dict[str, Tuple[str, str]],
+        want_images: bool,
+        **kwargs: Any,
+    ) -> Tuple[str, List[str]]:
+        """Render a slide to its markdown text and the markdown of each of its pictures."""
+        text_parts = []
+        slide_images = []
+        title = slide.shapes.title
+
+        # Walk the shapes depth first in reading order, the members of a group
+        # are visited right after the group itself
+        stack = _sorted_by_position(slide.shapes)
+        stack.reverse()
+        while stack:
+            shape = stack.pop()
+            shape_type = shape.shape_type
+            # Pictures, placeholders count when they hold an image. The image
+            # resolved for that check is passed on rather than looked up again.
+            image = getattr(shape, "image", None) if shape_type == _PLACEHOLDER else None
+            if shape_type == _PICTURE or image is not None:
+                slide_images.append(self._render_picture(shape, image, b64_cache, want_images))
+
+            # Tables
+            if shape_type == _TABLE:
+                text_parts.append(self._convert_table_to_markdown(shape.table, **kwargs))
+
+            # Charts
+            if shape.has_chart:
+                text_parts.append(self._convert_chart_to_markdown(shape.chart))
+
+            # Text areas
+            elif shape.has_text_frame:
+                if shape == title:
+                    text_parts.append("# " + shape.text.lstrip() + "\n")
+                else:
+                    text_parts.append(shape.text + "\n")
+
+            # Group Shapes
+            if shape_type == _GROUP:
+                members = _sorted_by_position(shape.shapes)
+                members.reverse()
+                stack.extend(members)
 
-    def _is_table(self, shape):
-        if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.TABLE:
-            return True
-        return False
+        # Add notes if present
+        if slide.has_notes_slide:
+            notes_frame = slide.notes_slide.notes_text_frame
+            if notes_frame is not None:
+                text_parts.append("\n\n### Notes:\n" + notes_frame.text)
+
+        return "".join(text_parts).strip(), slide_images
+
+    def _render_picture(
+        self,
+        shape,
+        image,
+        b64_cache: Dict[str, Tuple[str, str]],
+        want_images: bool,
+    ) -> str:
+        """Render a picture as markdown, embedding it as a data URI when images are wanted."""
+        # https://github.com/scanny/python-pptx/pull/512#issuecomment-1713100069
+        alt_text = ""
+
+        try:
+            alt_text = shape._element._nvXxPr.cNvPr.attrib.get("descr", "")
+        except Exception:
+            pass
+
+        # Prepare the alt, escaping any special characters
+        alt_text = alt_text or shape.name
+        alt_text = _ALT_TEXT_SPECIAL_RE.sub(" ", alt_text)
+        alt_text = _WHITESPACE_RE.sub(" ", alt_text).strip()
+
+        if want_images:
+            content_type, b64_string = self._encode_picture(shape, image, b64_cache)
+            return f"\n![{alt_text}](data:{content_type};base64,{b64_string})\n"
+        filename = _NON_WORD_RE.sub("", shape.name) + ".jpg"
+        return f"\n![{alt_text}]({filename})\n"
+
+    def _encode_picture(self, shape, image, b64_cache: Dict[str, Tuple[str, str]]) -> Tuple[str, str]:
+        """
+        Return the content type and base64 data of a picture, encoding each image part once.
+
+        image is the picture's already resolved pptx Image, or None to resolve
+        it only if the part has not been encoded yet.
+        """
+        try:
+            key = shape.part.related_part(shape._element.blip_rId).partname
+        except Exception:
+            key = None
+
+        cached = b64_cache.get(key) if key is not None else None
+        if cached is not None:
+            return cached
+
+        if image is None:
+            image = shape.image
+        encoded = (image.content_type or "image/png", b64encode(image.blob).decode("ascii"))
+        if key is not None:
+            b64_cache[key] = encoded
+        return encoded
 
     def _convert_table_to_markdown(self, table, **kwargs):
         # Write the table as HTML, then convert it to Markdown
-        html_table = "<html><body><table>"
-        first_row = True
+        escape = html.escape
+        html_parts = ["<html><body><table>"]
+        open_tag, close_tag = "<th>", "</th>"
         for row in table.rows:
-            html_table += "<tr>"
+            html_parts.append("<tr>")
             for cell in row.cells:
-                if first_row:
-                    html_table += "<th>" + html.escape(cell.text) + "</th>"
-                else:
-                    html_table += "<td>" + html.escape(cell.text) + "</td>"
-            html_table += "</tr>"
-            first_row = False
-        html_table += "</table></body></html>"
+                html_parts.append(open_tag + escape(cell.text) + close_tag)
+            html_parts.append("</tr>")
+            # Only the first row is a header
+            open_tag, close_tag = "<td>", "</td>"
+        html_parts.append("</table></body></html>")
+        html_table = "".join(html_parts)
 
         return (
             self._html_converter.convert_string(
@@ -183,14 +235,14 @@ class PptxConverter(DocumentConverter):
             md += "\n\n"
             data = []
             category_names = [c.label for c in chart.plots[0].categories]
-            series_names = [s.name for s in chart.series]
-            data.append(["Category"] + series_names)
+            series_list = list(chart.series)
+            data.append(["Category"] + [s.name for s in series_list])
 
+            # Each series.values access re-reads the series XML, so read each
+            # series once and transpose
+            series_values = [s.values for s in series_list]
             for idx, category in enumerate(category_names):
-                row = [category]
-                for series in chart.series:
-                    row.append(series.values[idx])
-                data.append(row)
+                data.append([category] + [values[idx] for values in series_values])
 
             markdown_table = []
             for row in data:
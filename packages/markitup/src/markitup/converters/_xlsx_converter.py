@@ -1,4 +1,4 @@
-from typing import BinaryIO, Any
+from typing import BinaryIO, Any, Optional
 from ._html_converter import HtmlConverter
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._schemas import StreamInfo, Config
@@ -10,9 +10,9 @@ class XlsxConverter(DocumentConverter):
     Converts XLSX files to Markdown, with each sheet presented as a separate Markdown table.
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Optional[Config] = None):
         super().__init__(config=config)
-        self._html_converter = HtmlConverter(config=config)
+        self._html_converter = HtmlConverter(config=self.config)
 
     def convert(
         self,
@@ -21,18 +21,18 @@ class XlsxConverter(DocumentConverter):
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
         sheets = pd.read_excel(file_stream, sheet_name=None, engine="openpyxl")
-        md_content = ""
+        md_parts = []
         for s in sheets:
-            md_content += f"## {s}\n"
+            md_parts.append(f"## {s}\n")
             html_content = sheets[s].to_html(index=False)
-            md_content += (
+            md_parts.append(
                 self._html_converter.convert_string(
                     html_content, **kwargs
                 ).markdown.strip()
-                + "\n\n"
             )
+            md_parts.append("\n\n")
 
-        return DocumentConverterResult(markdown=md_content.strip(), config=self.config)
+        return DocumentConverterResult(markdown="".join(md_parts).strip(), config=self.config)
 
 
 class XlsConverter(DocumentConverter):
@@ -40,9 +40,9 @@ class XlsConverter(DocumentConverter):
     Converts XLS files to Markdown, with each sheet presented as a separate Markdown table.
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Optional[Config] = None):
         super().__init__(config=config)
-        self._html_converter = HtmlConverter(config=config)
+        self._html_converter = HtmlConverter(config=self.config)
 
     def convert(
         self,
@@ -52,15 +52,15 @@ class XlsConverter(DocumentConverter):
     ) -> DocumentConverterResult:
 
         sheets = pd.read_excel(file_stream, sheet_name=None, engine="xlrd")
-        md_content = ""
+        md_parts = []
         for s in sheets:
-            md_content += f"## {s}\n"
+            md_parts.append(f"## {s}\n")
             html_content = sheets[s].to_html(index=False)
-            md_content += (
+            md_parts.append(
                 self._html_converter.convert_string(
                     html_content, **kwargs
                 ).markdown.strip()
-                + "\n\n"
             )
+            md_parts.append("\n\n")
 
-        return DocumentConverterResult(markdown=md_content.strip(), config=self.config)
+        return DocumentConverterResult(markdown="".join(md_parts).strip(), config=self.config)
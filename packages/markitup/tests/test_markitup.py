@@ -1,28 +1,69 @@
+import base64
+import io
+import os
+import re
+import sys
 import unittest
-from markitup import MarkItUp, Config
+from unittest import mock
+import numpy
+import pptx
+from PIL import Image
+from markitup import MarkItUp, Config, StreamInfo, FailedConversionAttempt, FileConversionException
+from markitup import _base_converter
+from markitup.converters import _pptx_converter
+from markitup._base_converter import DocumentConverterResult, _b64encode_stream
 from markitup.converter_utils.utils import read_files_to_bytestreams
 
-fs = read_files_to_bytestreams('tests/test_files')
+TEST_FILES_DIR = os.path.join(os.path.dirname(__file__), "test_files")
+
+fs = None
+
+
+def setUpModule():
+    # Load the test files once, when the tests run rather than at import
+    global fs
+    fs = {name: stream.getvalue() for name, stream in read_files_to_bytestreams(TEST_FILES_DIR).items()}
+
+
+def open_test_file(name):
+    # A fresh stream per test over the cached bytes, so no test sees another
+    # test's read position
+    return io.BytesIO(fs[name])
 
 
 class TestMarkItUp(unittest.TestCase):
-    def setUp(self):
-        print("Setting up test environment")
-        print(fs)
+    @classmethod
+    def setUpClass(cls):
+        # One instance per configuration, shared by the tests
+        cls.default_mu = MarkItUp()
+        cls.image_only = MarkItUp(config=Config(modalities=["image"]))
+        cls.audio_only = MarkItUp(config=Config(modalities=["audio"]))
+        cls.no_modalities = MarkItUp(config=Config(modalities=[]))
+        cls.image_audio = MarkItUp(config=Config(modalities=["image", "audio"]))
 
     def test_plain_text_conversion(self):
         """Test converting a plain text file to markdown."""
-        markitup = MarkItUp()
-        # fs['test.txt'].seek(0)
-        result, info = markitup.convert(fs['test.txt'], 'test.txt')
+        markitup = self.default_mu
+        result, info = markitup.convert(open_test_file('test.txt'), 'test.txt')
         self.assertIsNotNone(result)
         self.assertEqual(info.category, "text")
         self.assertTrue(result.to_llm(), "Content should not be empty")
 
+    def test_plain_text_legacy_encoding(self):
+        """Text that is not valid UTF-8 falls back to charset detection."""
+        text = "Grüße aus München! Die Straße führt über die Brücke zum Schloss, wo schöne Gärten blühen.\n" * 3
+        data = text.encode("cp1252")
+        with self.assertRaises(UnicodeDecodeError):
+            data.decode("utf-8")
+
+        stream_info = StreamInfo(magic_type="text/plain", category="text")
+        result, _ = self.default_mu.convert(io.BytesIO(data), 'german.txt', stream_info=stream_info)
+        self.assertEqual(result.markdown, text)
+
     def test_docx_conversion(self):
         """Test converting a DOCX file to markdown."""
-        markitup = MarkItUp()
-        result, info = markitup.convert(fs['test.docx'], 'test.docx')
+        markitup = self.default_mu
+        result, info = markitup.convert(open_test_file('test.docx'), 'test.docx')
             
         self.assertIsNotNone(result)
         self.assertEqual(info.category, "docx")
@@ -30,8 +71,8 @@ class TestMarkItUp(unittest.TestCase):
         
     def test_docx_with_comments_conversion(self):
         """Test converting a DOCX file with comments to markdown."""
-        markitup = MarkItUp()
-        result, info = markitup.convert(fs['test_with_comment.docx'], 'test_with_comment.docx')
+        markitup = self.default_mu
+        result, info = markitup.convert(open_test_file('test_with_comment.docx'), 'test_with_comment.docx')
             
         self.assertIsNotNone(result)
         self.assertEqual(info.category, "docx")
@@ -39,8 +80,8 @@ class TestMarkItUp(unittest.TestCase):
         
     def test_pdf_conversion(self):
         """Test converting a PDF file to markdown."""
-        markitup = MarkItUp()
-        result, info = markitup.convert(fs['test.pdf'], 'test.pdf')
+        markitup = self.default_mu
+        result, info = markitup.convert(open_test_file('test.pdf'), 'test.pdf')
             
         self.assertIsNotNone(result)
         self.assertEqual(info.category, "pdf")
@@ -52,8 +93,8 @@ class TestMarkItUp(unittest.TestCase):
         
         for html_file in html_files:
             with self.subTest(file=html_file):
-                markitup = MarkItUp()
-                result, info = markitup.convert(fs[html_file], html_file)
+                markitup = self.default_mu
+                result, info = markitup.convert(open_test_file(html_file), html_file)
                     
                 self.assertIsNotNone(result)
                 self.assertEqual(info.category, "html")
@@ -61,8 +102,8 @@ class TestMarkItUp(unittest.TestCase):
 
     def test_xlsx_conversion(self):
         """Test converting an XLSX file to markdown."""
-        markitup = MarkItUp()
-        result, info = markitup.convert(fs['test.xlsx'], 'test.xlsx')
+        markitup = self.default_mu
+        result, info = markitup.convert(open_test_file('test.xlsx'), 'test.xlsx')
             
         self.assertIsNotNone(result)
         self.assertEqual(info.category, "xlsx")
@@ -70,8 +111,8 @@ class TestMarkItUp(unittest.TestCase):
         
     def test_xls_conversion(self):
         """Test converting an XLS file to markdown."""
-        markitup = MarkItUp()
-        result, info = markitup.convert(fs['test.xls'], 'test.xls')
+        markitup = self.default_mu
+        result, info = markitup.convert(open_test_file('test.xls'), 'test.xls')
             
         self.assertIsNotNone(result)
         self.assertEqual(info.category, "xls")
@@ -83,8 +124,8 @@ class TestMarkItUp(unittest.TestCase):
         
         for csv_file in csv_files:
             with self.subTest(file=csv_file):
-                markitup = MarkItUp()
-                result, info = markitup.convert(fs[csv_file], csv_file)
+                markitup = self.default_mu
+                result, info = markitup.convert(open_test_file(csv_file), csv_file)
                     
                 self.assertIsNotNone(result)
                 self.assertEqual(info.category, "csv")
@@ -92,8 +133,8 @@ class TestMarkItUp(unittest.TestCase):
                 
     def test_pptx_conversion(self):
         """Test converting a PPTX file to markdown."""
-        markitup = MarkItUp()
-        result, info = markitup.convert(fs['test.pptx'], 'test.pptx')
+        markitup = self.default_mu
+        result, info = markitup.convert(open_test_file('test.pptx'), 'test.pptx')
             
         self.assertIsNotNone(result)
         self.assertEqual(info.category, "pptx")
@@ -105,8 +146,8 @@ class TestMarkItUp(unittest.TestCase):
         
         for audio_file in audio_files:
             with self.subTest(file=audio_file):
-                markitup = MarkItUp(config=Config(modalities=["audio"]))
-                result, info = markitup.convert(fs[audio_file], audio_file)
+                markitup = self.audio_only
+                result, info = markitup.convert(open_test_file(audio_file), audio_file)
                     
                 self.assertIsNotNone(result)
                 self.assertEqual(info.category, "audio")
@@ -115,9 +156,8 @@ class TestMarkItUp(unittest.TestCase):
     def test_image_in_config(self):
         """Test with only image in modalities config."""
         # Configure with only image modality
-        config = Config(modalities=["image"])
-        markitup = MarkItUp(config=config)
-        result, info = markitup.convert(fs['test.pdf'], 'test.pdf')
+        markitup = self.image_only
+        result, info = markitup.convert(open_test_file('test.pdf'), 'test.pdf')
             
         self.assertIsNotNone(result)
         self.assertEqual(info.category, "pdf")
@@ -126,9 +166,8 @@ class TestMarkItUp(unittest.TestCase):
     def test_audio_in_config(self):
         """Test with only audio in modalities config."""
         # Configure with only audio modality
-        config = Config(modalities=["audio"])
-        markitup = MarkItUp(config=config)
-        result, info = markitup.convert(fs['test.docx'], 'test.docx')
+        markitup = self.audio_only
+        result, info = markitup.convert(open_test_file('test.docx'), 'test.docx')
             
         self.assertIsNotNone(result)
         self.assertEqual(info.category, "docx")
@@ -137,9 +176,8 @@ class TestMarkItUp(unittest.TestCase):
     def test_no_modalities_config(self):
         """Test with empty modalities config."""
         # Configure with no modalities
-        config = Config(modalities=[])
-        markitup = MarkItUp(config=config)
-        result, info = markitup.convert(fs['test_with_comment.docx'], 'test_with_comment.docx')
+        markitup = self.no_modalities
+        result, info = markitup.convert(open_test_file('test_with_comment.docx'), 'test_with_comment.docx')
             
         self.assertIsNotNone(result)
         self.assertEqual(info.category, "docx")
@@ -147,10 +185,10 @@ class TestMarkItUp(unittest.TestCase):
         
     def test_unsupported_format(self):
         """Test handling of an unsupported file format."""
-        markitup = MarkItUp()
+        markitup = self.default_mu
         with self.assertRaises(Exception):
             # Should raise an exception for unsupported format
-            markitup.convert(fs['random.bin'], 'random.bin')
+            markitup.convert(open_test_file('random.bin'), 'random.bin')
                 
     def test_multiple_files_same_config(self):
         """Test converting multiple files with the same configuration."""
@@ -161,13 +199,12 @@ class TestMarkItUp(unittest.TestCase):
             "test.xlsx": "xlsx"
         }
         
-        # Create a single configuration to use for all conversions
-        config = Config(modalities=["image", "audio"])
-        markitup = MarkItUp(config=config)
+        # Use a single configuration for all conversions
+        markitup = self.image_audio
         
         for filename, expected_category in test_files.items():
             with self.subTest(file=filename):
-                result, info = markitup.convert(fs[filename], filename)
+                result, info = markitup.convert(open_test_file(filename), filename)
                     
                 self.assertIsNotNone(result)
                 self.assertEqual(info.category, expected_category)
@@ -175,8 +212,8 @@ class TestMarkItUp(unittest.TestCase):
                 
     def test_to_llm_method(self):
         """Test the to_llm method of the conversion result."""
-        markitup = MarkItUp()
-        result, info = markitup.convert(fs['test.docx'], 'test.docx')
+        markitup = self.default_mu
+        result, info = markitup.convert(open_test_file('test.docx'), 'test.docx')
             
         # Call the to_llm method and check the result
         llm_format = result.to_llm()
@@ -187,6 +224,261 @@ class TestMarkItUp(unittest.TestCase):
         if llm_format:
             self.assertIn("type", llm_format[0])
 
+    def test_modalities_change_after_conversion(self):
+        """Changing the config's modalities applies to later conversions of the same instance."""
+        markitup = MarkItUp()
+        result, _ = markitup.convert(open_test_file('test.pdf'), 'test.pdf')
+        self.assertIn("data:image/", result.markdown)
+
+        markitup.config.modalities = []
+        result, _ = markitup.convert(open_test_file('test.pdf'), 'test.pdf')
+        self.assertNotIn("data:image/", result.markdown)
+
+    def test_pptx_shared_image_encoded_once(self):
+        """Pictures that share one image part get the same payload, encoded once per conversion."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (16, 16), "purple").save(buffer, format="PNG")
+        png_data = buffer.getvalue()
+
+        presentation = pptx.Presentation()
+        for _ in range(2):
+            slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+            slide.shapes.add_picture(io.BytesIO(png_data), 0, 0)
+        slide.shapes.add_picture(io.BytesIO(png_data), 100, 100)
+        deck = io.BytesIO()
+        presentation.save(deck)
+        deck.seek(0)
+
+        b64encode = mock.Mock(wraps=_pptx_converter.b64encode)
+        with mock.patch.object(_pptx_converter, "b64encode", b64encode):
+            result, _ = self.default_mu.convert(deck, 'deck.pptx')
+
+        payloads = re.findall(r"data:image/png;base64,([^)]+)\)", result.markdown)
+        self.assertEqual(len(payloads), 3)
+        self.assertEqual(set(payloads), {base64.b64encode(png_data).decode("ascii")})
+        self.assertEqual(b64encode.call_count, 1)
+
+    def test_from_path(self):
+        """Test converting a file opened with MarkItUp.from_path."""
+        markitup = self.default_mu
+        stream, stream_info = MarkItUp.from_path(os.path.join(TEST_FILES_DIR, 'test.xlsx'))
+        with stream:
+            self.assertEqual(stream_info.category, "xlsx")
+            result, info = markitup.convert(stream, 'test.xlsx', stream_info=stream_info)
+
+        self.assertIs(info, stream_info)
+        self.assertTrue(result.to_llm(), "Content should not be empty")
+
+    def test_from_path_closes_stream_on_error(self):
+        """MarkItUp.from_path closes the file it opened when sniffing it fails."""
+        streams = []
+
+        def failing_sniff(stream, file_name):
+            streams.append(stream)
+            raise RuntimeError("sniffing failed")
+
+        with mock.patch.object(MarkItUp, "_get_stream_info", side_effect=failing_sniff):
+            with self.assertRaises(RuntimeError):
+                MarkItUp.from_path(os.path.join(TEST_FILES_DIR, 'random.bin'))
+
+        self.assertEqual(len(streams), 1)
+        self.assertTrue(streams[0].closed)
+
+
+def image_markdown(fmt, size, color="red", alt="image"):
+    """Markdown embedding a solid color image as a base64 data URI."""
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, format=fmt)
+    b64_data = base64.b64encode(buffer.getvalue()).decode("ascii")
+    return f"![{alt}](data:image/{fmt.lower()};base64,{b64_data})"
+
+
+class FakeTurboJPEG:
+    """Stands in for PyTurboJPEG's TurboJPEG, scaling with Pillow."""
+
+    scaling_factors = frozenset({(1, 8), (1, 4), (3, 8), (1, 2), (5, 8), (3, 4), (7, 8), (1, 1)})
+
+    def __init__(self):
+        self.decoded_with = []
+
+    def decode_header(self, data):
+        img = Image.open(io.BytesIO(data))
+        return img.width, img.height, 0, 0
+
+    def decode(self, data, scaling_factor=None):
+        self.decoded_with.append(scaling_factor)
+        num, denom = scaling_factor
+        img = Image.open(io.BytesIO(data)).convert("RGB")
+        img = img.resize((-(-img.width * num // denom), -(-img.height * num // denom)))
+        # TurboJPEG decodes to BGR by default
+        return numpy.asarray(img)[..., ::-1].copy()
+
+
+class TestImageProcessing(unittest.TestCase):
+    def test_large_jpeg_converted_to_webp_with_turbojpeg(self):
+        """A large JPEG still becomes WebP under the default config when turbojpeg is available."""
+        markdown = image_markdown("JPEG", (1600, 1200), color="blue")
+        result = DocumentConverterResult(markdown=markdown, config=Config())
+        with mock.patch.object(_base_converter, "pyvips", None), \
+                mock.patch.object(_base_converter, "_turbo_jpeg", object()), \
+                mock.patch.object(DocumentConverterResult, "_resize_jpeg_turbo") as resize:
+            llm_format = result.to_llm()
+
+        resize.assert_not_called()
+        self.assertEqual(len(llm_format), 1)
+        self.assertTrue(llm_format[0]["image_url"]["url"].startswith("data:image/webp;base64,"))
+
+    def test_large_jpeg_resized_exactly_with_turbojpeg(self):
+        """The turbojpeg path pre-scales in the DCT domain, then resizes to the exact bound."""
+        markdown = image_markdown("JPEG", (1600, 1200), color="yellow")
+        config = Config(image_use_webp=False, image_max_width_or_height=768)
+        turbo_jpeg = FakeTurboJPEG()
+        with mock.patch.object(_base_converter, "_turbo_jpeg", turbo_jpeg):
+            llm_format = DocumentConverterResult(markdown=markdown, config=config).to_llm()
+
+        # 1/2 is the smallest factor that keeps the longest side at least 768
+        self.assertEqual(turbo_jpeg.decoded_with, [(1, 2)])
+        url = llm_format[0]["image_url"]["url"]
+        self.assertTrue(url.startswith("data:image/jpeg;base64,"))
+        image = Image.open(io.BytesIO(base64.b64decode(url.split(",", 1)[1])))
+        self.assertEqual(image.format, "JPEG")
+        self.assertEqual(image.size, (768, 576))
+
+    def test_unclosed_alt_text_does_not_swallow_text(self):
+        """An unclosed image bracket on an earlier line stays text instead of becoming alt text."""
+        markdown = "Intro![draft\n\nImportant paragraph\n\n" + image_markdown("PNG", (8, 8), alt="logo")
+        result = DocumentConverterResult(markdown=markdown, config=Config(image_use_webp=False))
+        llm_format = result.to_llm()
+
+        self.assertEqual([item["type"] for item in llm_format], ["text", "image_url"])
+        self.assertIn("Important paragraph", llm_format[0]["text"])
+
+    def test_brackets_in_alt_text(self):
+        """Alt text containing brackets still matches as an image."""
+        markdown = "Intro\n\n" + image_markdown("PNG", (8, 8), alt="Figure [1] chart")
+        result = DocumentConverterResult(markdown=markdown, config=Config(image_use_webp=False))
+        llm_format = result.to_llm()
+
+        self.assertEqual([item["type"] for item in llm_format], ["text", "image_url"])
+        self.assertEqual(llm_format[0]["text"], "Intro")
+
+    def test_resize_without_webp_keeps_format(self):
+        """A resized image is re-saved in its original format when WebP is disabled."""
+        markdown = image_markdown("PNG", (200, 100), color="green")
+        config = Config(image_use_webp=False, image_max_width_or_height=64)
+        llm_format = DocumentConverterResult(markdown=markdown, config=config).to_llm()
+
+        url = llm_format[0]["image_url"]["url"]
+        self.assertTrue(url.startswith("data:image/png;base64,"))
+        image = Image.open(io.BytesIO(base64.b64decode(url.split(",", 1)[1])))
+        self.assertEqual(image.size, (64, 32))
+
+    def test_unsupported_image_without_processing(self):
+        """Unsupported images become placeholders even when no resize or WebP conversion is needed."""
+        b64_data = base64.b64encode(b'<svg xmlns="http://www.w3.org/2000/svg"/>').decode("ascii")
+        markdown = f"![icon](data:image/svg+xml;base64,{b64_data})"
+        config = Config(image_use_webp=False, image_max_width_or_height=0, ignore_unsupported_image=True)
+        llm_format = DocumentConverterResult(markdown=markdown, config=config).to_llm()
+
+        self.assertEqual(llm_format[0]["type"], "text")
+        self.assertIn("unsupported 'image/svg+xml' image 'icon'", llm_format[0]["text"])
+
+        config.ignore_unsupported_image = False
+        with self.assertRaises(Exception):
+            DocumentConverterResult(markdown=markdown, config=config).to_llm()
+
+
+class ShortReadStream(io.RawIOBase):
+    """A stream that returns at most a few bytes per read, like a socket or pipe."""
+
+    def __init__(self, data, max_read):
+        self._data = io.BytesIO(data)
+        self._max_read = max_read
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        if size < 0:
+            size = self._max_read
+        return self._data.read(min(size, self._max_read))
+
+
+class TestToLlmIter(unittest.TestCase):
+    def test_without_config(self):
+        """A result built without a config still converts its text."""
+        result = DocumentConverterResult("hello")
+        self.assertEqual(result.to_llm(), [{"type": "text", "text": "hello"}])
+
+    def test_yields_same_elements_as_to_llm(self):
+        """to_llm_iter lazily yields the same elements, in order, as to_llm."""
+        markdown = "Before\n\n" + image_markdown("PNG", (8, 8)) + "\n\nAfter"
+        result = DocumentConverterResult(markdown=markdown, config=Config(image_use_webp=False))
+
+        iterator = result.to_llm_iter()
+        self.assertNotIsInstance(iterator, list)
+        self.assertEqual(next(iterator), {"type": "text", "text": "Before"})
+        self.assertEqual(next(iterator)["type"], "image_url")
+        self.assertEqual(next(iterator), {"type": "text", "text": "After"})
+        self.assertIsNone(next(iterator, None))
+
+        self.assertEqual(list(result.to_llm_iter()), result.to_llm())
+
+
+class TestB64EncodeStream(unittest.TestCase):
+    def test_matches_stdlib_encoding(self):
+        """Encoding a stream in pieces gives the same result as encoding it at once."""
+        for length in (0, 1, 2, 3, 4, 5, 57, 58, 1000):
+            data = os.urandom(length)
+            with self.subTest(length=length):
+                self.assertEqual(
+                    _b64encode_stream(io.BytesIO(data)),
+                    base64.b64encode(data).decode("ascii"))
+
+    def test_short_reads_carry_remainder(self):
+        """Reads that are not a multiple of 3 bytes do not introduce padding mid-stream."""
+        data = os.urandom(1000)
+        for max_read in (1, 2, 4, 7, 100):
+            with self.subTest(max_read=max_read):
+                self.assertEqual(
+                    _b64encode_stream(ShortReadStream(data, max_read)),
+                    base64.b64encode(data).decode("ascii"))
+
+
+class TestFileConversionException(unittest.TestCase):
+    def test_message_lists_attempts(self):
+        """The default message names each failed converter and its error."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        attempts = [
+            FailedConversionAttempt(converter=Config()),
+            FailedConversionAttempt(converter=MarkItUp(), exc_info=exc_info),
+        ]
+        exception = FileConversionException(attempts=attempts)
+
+        self.assertIs(exception.attempts, attempts)
+        self.assertEqual(
+            str(exception),
+            "File conversion failed after 2 attempts:\n"
+            " - Config provided no execution info.\n"
+            " - MarkItUp threw ValueError with message: boom\n")
+
+    def test_attempt_without_converter(self):
+        """An attempt without a converter has no converter name."""
+        attempt = FailedConversionAttempt()
+        self.assertIsNone(attempt.converter_name)
+        self.assertEqual(
+            str(FileConversionException(attempts=[attempt])),
+            "File conversion failed after 1 attempts:\n"
+            " - Unknown converter provided no execution info.\n")
+
+    def test_default_and_explicit_message(self):
+        """Without attempts the message is generic, an explicit message is kept as-is."""
+        self.assertEqual(str(FileConversionException()), "File conversion failed.")
+        self.assertEqual(str(FileConversionException("custom")), "custom")
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file